@@ -4,26 +4,95 @@ YouTube Channel & Playlist Manager
 - Features:
   * Create Video objects
   * Create Playlists and add/remove videos
-  * Save / Load playlists to/from text files and JSON
+  * Save / Load playlists to/from text files and JSON (or a compact binary .pl format)
   * Create Channel, display playlists, search by name
-  * Export/import channel (JSON)
+  * Export/import channel (JSON, optionally gzip-compressed as .json.gz)
   * Polished GOLD × BLACK visual theme
   * Styled Listboxes, programmatic icons, gradient header, and splash screen
 
 Run: python YouTube_Playlist_Manager.py
-Requires: Python 3.x (standard library only)
+Requires: Python 3.10+ (standard library only; uses orjson for faster JSON if installed)
 """
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+import functools
+import gzip
 import json
 import os
+import re
+import struct
+import tempfile
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
 import time
 from typing import List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# large buffer for whole-file reads/writes (default is only 8 KiB)
+_IO_BUFFER = 1024 * 1024
+
+# binary playlist (.pl) layout: header, then per video a record followed by the UTF-8 title
+_PL_MAGIC = b'YTPL'
+_PL_HEADER = struct.Struct('<4sI')    # magic, video count
+_PL_RECORD = struct.Struct('<iqH')    # duration, views, title length in bytes
+
+# ----------------- File Helpers -----------------
+# read once at import (os.umask can only be read by setting it, which is not thread-safe)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _write_atomic(filename: str, data: bytes):
+    """Write data with one write() to a temp file, then swap it into place."""
+    directory = os.path.dirname(filename) or '.'
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=os.path.basename(filename) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=_IO_BUFFER) as f:
+            f.write(data)
+            # make sure the bytes are on disk before the rename makes them visible
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file as 0600; give it the permissions a plain open() would
+        try:
+            mode = os.stat(filename).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp, mode)
+        os.replace(tmp, filename)
+    except BaseException:
+        # never leave a stray temp file behind; the original stays untouched
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+# ----------------- JSON Helpers -----------------
+# orjson only handles 64-bit integers; it refuses to dump larger ones and
+# silently parses them as floats, so such documents go through stdlib json.
+# Any 20+ digit run (or a 19-digit negative) may be one of those.
+_BIG_INT = re.compile(rb'\d{20}|-\d{19}')
+
+def _dumps(obj, indent=False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            pass  # e.g. an int outside the 64-bit range
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _loads(buf: bytes):
+    """Parse JSON from UTF-8 bytes, using orjson when available."""
+    if orjson is not None and not _BIG_INT.search(buf):
+        return orjson.loads(buf)
+    return json.loads(buf)
+
 # ----------------- Data Models -----------------
-@dataclass
+@dataclass(slots=True)
 class Video:
     title: str
     duration: int  # seconds
@@ -34,39 +103,94 @@ class Video:
         dur = f"{mins}m{secs}s" if mins else f"{secs}s"
         return f"{self.title} — {dur} — {self.views} views"
 
+    def as_dict(self):
+        # cheaper than dataclasses.asdict(), which recurses and deep-copies
+        return {"title": self.title, "duration": self.duration, "views": self.views}
+
 class Playlist:
     def __init__(self, playListName: str, plID: int):
         self.playListName = playListName
         self.plID = plID
         self.videos: List[Video] = []
+        # str() of each video, kept in step with self.videos for the Listbox
+        self._display_strings: List[str] = []
 
     def add_video(self, video: Video):
         self.videos.append(video)
+        self._display_strings.append(str(video))
 
     def remove_video(self, index: int):
         if 0 <= index < len(self.videos):
             del self.videos[index]
+            del self._display_strings[index]
+
+    def display_videos(self):
+        return self._display_strings
 
     def save_playlist_to_file(self, filename: str):
-        # each line is a JSON object for a video
-        with open(filename, 'w', encoding='utf-8') as f:
-            for v in self.videos:
-                line = json.dumps(asdict(v), ensure_ascii=False)
-                f.write(line + '\n')
+        # the whole playlist is a single JSON array of video objects
+        data = _dumps([v.as_dict() for v in self.videos])
+        _write_atomic(filename, data)
 
     def load_playlist_from_file(self, filename: str):
         self.videos = []
-        with open(filename, 'r', encoding='utf-8') as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                data = json.loads(line.strip())
-                v = Video(data['title'], int(data['duration']), int(data['views']))
-                self.add_video(v)
+        self._display_strings = []
+        with open(filename, 'rb', buffering=_IO_BUFFER) as f:
+            raw = f.read()
+        if raw.lstrip()[:1] == b'[':
+            records = _loads(raw)
+        else:
+            # older files: one JSON object per line
+            records = [_loads(line) for line in raw.splitlines() if line.strip()]
+        for data in records:
+            v = Video(data['title'], int(data['duration']), int(data['views']))
+            self.add_video(v)
+
+    def save_binary(self, filename: str):
+        data = bytearray(_PL_HEADER.pack(_PL_MAGIC, len(self.videos)))
+        pack = _PL_RECORD.pack
+        for v in self.videos:
+            tb = v.title.encode('utf-8')
+            try:
+                data += pack(v.duration, v.views, len(tb))
+            except struct.error:
+                raise ValueError(f'Video {v.title[:40]!r} does not fit the binary format: duration must be a '
+                                 f'32-bit and views a 64-bit integer, title at most 65535 UTF-8 bytes') from None
+            data += tb
+        _write_atomic(filename, data)
+
+    def load_binary(self, filename: str):
+        with open(filename, 'rb', buffering=_IO_BUFFER) as f:
+            buf = memoryview(f.read())
+        size = len(buf)
+        if size < _PL_HEADER.size:
+            raise ValueError('Not a binary playlist file')
+        magic, count = _PL_HEADER.unpack_from(buf, 0)
+        if magic != _PL_MAGIC:
+            raise ValueError('Not a binary playlist file')
+        # parse into a local list so a bad file leaves the playlist untouched
+        videos = []
+        unpack_from = _PL_RECORD.unpack_from
+        record_size = _PL_RECORD.size
+        offset = _PL_HEADER.size
+        for _ in range(count):
+            if offset + record_size > size:
+                raise ValueError('Binary playlist file is truncated')
+            duration, views, tlen = unpack_from(buf, offset)
+            offset += record_size
+            if offset + tlen > size:
+                raise ValueError('Binary playlist file is truncated')
+            title = str(buf[offset:offset+tlen], 'utf-8')
+            offset += tlen
+            videos.append(Video(title, duration, views))
+        if offset != size:
+            raise ValueError('Binary playlist file has unexpected trailing data')
+        self.videos = videos
+        self._display_strings = [str(v) for v in videos]
 
     def to_dict(self):
         return {"playListName": self.playListName, "plID": self.plID,
-                "videos": [asdict(v) for v in self.videos]}
+                "videos": [v.as_dict() for v in self.videos]}
 
     @staticmethod
     def from_dict(d):
@@ -82,71 +206,141 @@ class Channel:
     def __init__(self, name: str = "My Channel"):
         self.name = name
         self.playlists: List[Playlist] = []
+        # lower-cased name -> first playlist with that name
+        self._by_name_lower = {}
+        # id(playlist) -> position in self.playlists (and the Listbox)
+        self._index = {}
 
     def add_playlist(self, playlist: Playlist):
+        self._index[id(playlist)] = len(self.playlists)
         self.playlists.append(playlist)
+        self._by_name_lower.setdefault(playlist.playListName.lower(), playlist)
+
+    def remove_playlist(self, index: int):
+        if 0 <= index < len(self.playlists):
+            del self.playlists[index]
+            self._reindex()
+
+    def _reindex(self):
+        self._by_name_lower = {}
+        self._index = {}
+        for i, pl in enumerate(self.playlists):
+            self._by_name_lower.setdefault(pl.playListName.lower(), pl)
+            self._index[id(pl)] = i
+
+    def index_of(self, playlist: Playlist):
+        return self._index.get(id(playlist))
 
     def display_playlists(self):
         return [str(p) for p in self.playlists]
 
     def search_playlist(self, name: str):
-        name = name.lower()
-        for pl in self.playlists:
-            if pl.playListName.lower() == name:
-                return pl
-        return None
+        return self._by_name_lower.get(name.lower())
+
+    def to_dict(self):
+        return {"name": self.name, "playlists": [p.to_dict() for p in self.playlists]}
+
+    def to_json(self, filename: str, pretty: bool = False):
+        Channel.write_json(filename, self.to_dict(), pretty)
 
-    def to_json(self, filename: str):
-        with open(filename, 'w', encoding='utf-8') as f:
-            obj = {"name": self.name, "playlists": [p.to_dict() for p in self.playlists]}
-            json.dump(obj, f, ensure_ascii=False, indent=2)
+    @staticmethod
+    def write_json(filename: str, obj, pretty: bool = False):
+        # obj is a to_dict() snapshot, so this can run off the Tk thread
+        # compact by default; pretty=True writes indented, human-readable JSON
+        data = _dumps(obj, indent=pretty)
+        if filename.endswith('.json.gz'):
+            data = gzip.compress(data, compresslevel=3)
+        _write_atomic(filename, data)
 
     def load_json(self, filename: str):
-        with open(filename, 'r', encoding='utf-8') as f:
-            obj = json.load(f)
-            self.name = obj.get('name', self.name)
-            self.playlists = [Playlist.from_dict(d) for d in obj.get('playlists', [])]
+        with open(filename, 'rb', buffering=_IO_BUFFER) as f:
+            data = f.read()
+        if data[:2] == b'\x1f\x8b':
+            data = gzip.decompress(data)
+        obj = _loads(data)
+        self.name = obj.get('name', self.name)
+        self.playlists = [Playlist.from_dict(d) for d in obj.get('playlists', [])]
+        self._reindex()
 
 # ----------------- UI Helpers -----------------
+_icon_cache = {}
+
 def create_square_icon(size, fg='#FFD700', bg='#000000', inner=False):
     """Create a simple square PhotoImage used as an icon (pure Tkinter)."""
+    key = (size, fg, bg, inner)
+    img = _icon_cache.get(key)
+    if img is not None:
+        return img
     img = tk.PhotoImage(width=size, height=size)
-    # fill background
-    pixels = [[bg]*size for _ in range(size)]
     if inner:
-        # draw a smaller golden square inside
+        # background border with a smaller golden square inside
         pad = max(1, size//6)
-        for y in range(pad, size-pad):
-            for x in range(pad, size-pad):
-                pixels[y][x] = fg
+        edge_row = '{' + ' '.join([bg]*size) + '}'
+        inner_row = '{' + ' '.join([bg]*pad + [fg]*(size-2*pad) + [bg]*pad) + '}'
+        rows = [edge_row]*pad + [inner_row]*(size-2*pad) + [edge_row]*pad
     else:
-        for y in range(size):
-            for x in range(size):
-                pixels[y][x] = fg
-    # put pixels
-    for y, row in enumerate(pixels):
-        img.put('{' + ' '.join(row) + '}', to=(0,y))
+        rows = ['{' + ' '.join([fg]*size) + '}']*size
+    # put all pixels in one call
+    img.put(' '.join(rows), to=(0,0))
+    _icon_cache[key] = img
     return img
 
 # Gradient drawing on canvas
-def draw_horizontal_gradient(canvas, x1, y1, x2, y2, start_color, end_color, steps=100):
-    # start_color/end_color are hex '#RRGGBB'
-    def hex_to_rgb(h):
-        h = h.lstrip('#')
-        return tuple(int(h[i:i+2],16) for i in (0,2,4))
-    def rgb_to_hex(r,g,b):
-        return f'#{r:02x}{g:02x}{b:02x}'
+# two-digit hex string for every channel value 0..255
+_HEX = [f'{i:02x}' for i in range(256)]
+
+def hex_to_rgb(h):
+    return tuple(bytes.fromhex(h.lstrip('#')))
+
+def rgb_to_hex(r,g,b):
+    return '#' + _HEX[r] + _HEX[g] + _HEX[b]
+
+@functools.lru_cache(maxsize=32)
+def _gradient_palette(start_color, end_color, steps):
+    """Return the `steps` interpolated '#rrggbb' colors from start to end."""
     sr,sg,sb = hex_to_rgb(start_color)
     er,eg,eb = hex_to_rgb(end_color)
-    width = x2 - x1
-    for i in range(steps):
-        frac = i/(steps-1)
-        r = int(sr + (er-sr)*frac)
-        g = int(sg + (eg-sg)*frac)
-        b = int(sb + (eb-sb)*frac)
-        color = rgb_to_hex(r,g,b)
-        x = x1 + int(width * i/steps)
-        canvas.create_rectangle(x, y1, x + int(width/steps)+1, y2, outline='', fill=color)
+    last = max(1, steps-1)
+    return tuple(rgb_to_hex(sr + (er-sr)*i//last, sg + (eg-sg)*i//last, sb + (eb-sb)*i//last)
+                 for i in range(steps))
+
+_gradient_cache = {}
+_GRADIENT_CACHE_SIZE = 16  # resizing produces a new width each step, so keep this bounded
+
+def get_gradient_image(width, height, start_color, end_color, steps=100):
+    """Return a (cached) PhotoImage filled with a left-to-right gradient."""
+    width = max(1, width)
+    height = max(1, height)
+    key = (width, height, start_color, end_color, steps)
+    img = _gradient_cache.get(key)
+    if img is not None:
+        return img
+    palette = _gradient_palette(start_color, end_color, steps)
+    # one row of pixels (each column takes its band's color); Tk tiles it down
+    row = '{' + ' '.join([palette[x*steps//width] for x in range(width)]) + '}'
+    img = tk.PhotoImage(width=width, height=height)
+    img.put(row, to=(0, 0, width, height))
+    if len(_gradient_cache) >= _GRADIENT_CACHE_SIZE:
+        # drop the oldest entry (dicts keep insertion order)
+        del _gradient_cache[next(iter(_gradient_cache))]
+    _gradient_cache[key] = img
+    return img
+
+def draw_horizontal_gradient(canvas, x1, y1, x2, y2, start_color, end_color, steps=100):
+    # start_color/end_color are hex '#RRGGBB'
+    img = get_gradient_image(x2 - x1, y2 - y1, start_color, end_color, steps)
+    # keep a reference on the canvas so the image is not garbage collected
+    # even after it has been evicted from the cache
+    canvas._gradient_image = img
+    # redraws reuse the canvas's existing gradient item instead of adding another
+    item = getattr(canvas, '_gradient_item', None)
+    if item is not None and canvas.type(item) == 'image':
+        canvas.coords(item, x1, y1)
+        canvas.itemconfigure(item, image=img)
+    else:
+        item = canvas.create_image(x1, y1, anchor='nw', image=img)
+        canvas._gradient_item = item
+    return item
 
 # Splash screen
 class Splash(tk.Toplevel):
@@ -169,6 +363,9 @@ class Splash(tk.Toplevel):
         self.canvas.create_text(w//2, h//2 + 30, text='Loading...', font=('Segoe UI', 12), fill='#111111')
 
 # ----------------- GUI -----------------
+# videos are added to the Listbox in batches as the user scrolls towards the end
+_VIDEO_BATCH = 200
+
 class App(tk.Tk):
     def _apply_style(self):
         style = ttk.Style()
@@ -234,7 +431,11 @@ class App(tk.Tk):
         # top gradient header
         header = tk.Canvas(self, height=90, highlightthickness=0)
         header.pack(fill='x')
-        draw_horizontal_gradient(header, 0, 0, self.winfo_screenwidth(), 90, '#000000', '#FFD700', steps=160)
+        # size the gradient to the canvas itself; resizes just swap in a (cached) image
+        def _draw_header(width):
+            draw_horizontal_gradient(header, 0, 0, width, 90, '#000000', '#FFD700', steps=160)
+        _draw_header(self.winfo_reqwidth())
+        header.bind('<Configure>', lambda e: _draw_header(e.width))
         header.create_text(40, 46, anchor='w', text='YouTube Playlist Manager', font=('Segoe UI', 18, 'bold'), fill='#000000')
 
         # main container
@@ -267,13 +468,17 @@ class App(tk.Tk):
         pw.add(mid, weight=2)
 
         ttk.Label(mid, text='Videos in Selected Playlist').pack(anchor='w')
-        self.video_listbox = tk.Listbox(mid, height=20, bg='#0d0d0d', fg='#FFD700', selectbackground='#B8860B', bd=0, highlightthickness=0)
+        self._video_rows = []
+        self._video_shown = 0
+        self.video_listbox = tk.Listbox(mid, height=20, bg='#0d0d0d', fg='#FFD700', selectbackground='#B8860B', bd=0, highlightthickness=0,
+                                        yscrollcommand=self._on_video_scroll)
         self.video_listbox.pack(fill='both', expand=True, pady=(6,8))
 
         vid_controls = ttk.Frame(mid)
         vid_controls.pack(fill='x', pady=6)
         ttk.Button(vid_controls, text='Remove Video', command=self.remove_video).pack(side='left')
         ttk.Button(vid_controls, text='Export Playlist to File', command=self.export_playlist_file).pack(side='left', padx=6)
+        ttk.Button(vid_controls, text='Export Binary', command=self.export_playlist_binary).pack(side='left')
 
         # Right: Add video form & search
         right = ttk.Frame(pw, width=300)
@@ -309,8 +514,10 @@ class App(tk.Tk):
         bottom.pack(fill='x', pady=(8,0))
 
         ttk.Button(bottom, text='Rename Channel', command=self.rename_channel).pack(side='left')
-        ttk.Button(bottom, text='Save Channel', command=self.save_channel).pack(side='left', padx=6)
-        ttk.Button(bottom, text='Load Channel', command=self.load_channel).pack(side='left')
+        self.save_channel_button = ttk.Button(bottom, text='Save Channel', command=self.save_channel)
+        self.save_channel_button.pack(side='left', padx=6)
+        self.load_channel_button = ttk.Button(bottom, text='Load Channel', command=self.load_channel)
+        self.load_channel_button.pack(side='left')
 
         # Footer status
         self.status_var = tk.StringVar(value='Ready')
@@ -327,27 +534,56 @@ class App(tk.Tk):
             messagebox.showwarning('Name required', 'Enter a valid channel name.')
 
     def save_channel(self):
-        filename = filedialog.asksaveasfilename(defaultextension='.json', filetypes=[('JSON files','*.json')])
+        filename = filedialog.asksaveasfilename(defaultextension='.json', filetypes=[('JSON files','*.json'), ('Compressed JSON','*.json.gz')])
         if not filename:
             return
-        try:
-            self.channel.to_json(filename)
+        def _done(_):
             self.status_var.set(f'Channel saved to {os.path.basename(filename)}')
-        except Exception as e:
-            messagebox.showerror('Save Error', str(e))
+        self.status_var.set('Saving channel...')
+        # snapshot on the Tk thread so edits made during the save can't leak into it
+        obj = self.channel.to_dict()
+        self._run_in_background(lambda: Channel.write_json(filename, obj), _done, 'Save Error')
 
     def load_channel(self):
-        filename = filedialog.askopenfilename(filetypes=[('JSON files','*.json')])
+        filename = filedialog.askopenfilename(filetypes=[('JSON files','*.json *.json.gz')])
         if not filename:
             return
-        try:
-            self.channel.load_json(filename)
+        name = self.channel.name
+        def _work():
+            # parse into a fresh Channel so the UI never sees a half-loaded one
+            channel = Channel(name)
+            channel.load_json(filename)
+            return channel
+        def _done(channel):
+            self.channel = channel
             # set next id
             self.next_playlist_id = max([p.plID for p in self.channel.playlists], default=0) + 1
             self.refresh_playlists()
+            self._clear_videos()
             self.status_var.set(f'Channel loaded from {os.path.basename(filename)}')
-        except Exception as e:
-            messagebox.showerror('Load Error', str(e))
+        self.status_var.set('Loading channel...')
+        self._run_in_background(_work, _done, 'Load Error')
+
+    def _run_in_background(self, work, on_done, error_title):
+        """Run work() on a worker thread, then on_done(result) on the Tk thread."""
+        buttons = (self.save_channel_button, self.load_channel_button)
+        for b in buttons:
+            b.configure(state='disabled')
+        def _finish(result, error):
+            for b in buttons:
+                b.configure(state='normal')
+            if error is not None:
+                self.status_var.set('Ready')
+                messagebox.showerror(error_title, str(error))
+            else:
+                on_done(result)
+        def _worker():
+            try:
+                result, error = work(), None
+            except Exception as e:
+                result, error = None, e
+            self.after(0, _finish, result, error)
+        threading.Thread(target=_worker, daemon=True).start()
 
     # ---------- Playlist actions ----------
     def create_playlist(self):
@@ -364,9 +600,9 @@ class App(tk.Tk):
             messagebox.showinfo('Select playlist', 'Choose a playlist to delete.')
             return
         idx = sel[0]
-        del self.channel.playlists[idx]
+        self.channel.remove_playlist(idx)
         self.refresh_playlists()
-        self.video_listbox.delete(0, 'end')
+        self._clear_videos()
         self.status_var.set('Playlist deleted')
 
     def save_selected_playlist(self):
@@ -392,11 +628,14 @@ class App(tk.Tk):
             return
         idx = sel[0]
         pl = self.channel.playlists[idx]
-        filename = filedialog.askopenfilename(filetypes=[('Text files','*.txt')])
+        filename = filedialog.askopenfilename(filetypes=[('Playlist files','*.txt *.pl'), ('Text files','*.txt'), ('Binary playlists','*.pl')])
         if not filename:
             return
         try:
-            pl.load_playlist_from_file(filename)
+            if filename.endswith('.pl'):
+                pl.load_binary(filename)
+            else:
+                pl.load_playlist_from_file(filename)
             self.on_playlist_select()
             self.status_var.set(f'Loaded playlist from {os.path.basename(filename)}')
         except Exception as e:
@@ -406,20 +645,56 @@ class App(tk.Tk):
         # same as save selected but simple quick export
         self.save_selected_playlist()
 
+    def export_playlist_binary(self):
+        sel = self.playlist_listbox.curselection()
+        if not sel:
+            messagebox.showinfo('Select playlist', 'Select a playlist to export.')
+            return
+        idx = sel[0]
+        pl = self.channel.playlists[idx]
+        filename = filedialog.asksaveasfilename(defaultextension='.pl', filetypes=[('Binary playlists','*.pl')], initialfile=f"{pl.playListName}.pl")
+        if not filename:
+            return
+        try:
+            pl.save_binary(filename)
+            self.status_var.set(f'Exported playlist to {os.path.basename(filename)}')
+        except Exception as e:
+            messagebox.showerror('Export Error', str(e))
+
     def refresh_playlists(self):
         self.playlist_listbox.delete(0, 'end')
-        for p in self.channel.playlists:
-            self.playlist_listbox.insert('end', str(p))
+        items = self.channel.display_playlists()
+        if items:
+            self.playlist_listbox.insert('end', *items)
 
     def on_playlist_select(self, event=None):
         sel = self.playlist_listbox.curselection()
-        self.video_listbox.delete(0, 'end')
+        self._clear_videos()
         if not sel:
             return
         idx = sel[0]
         pl = self.channel.playlists[idx]
-        for v in pl.videos:
-            self.video_listbox.insert('end', str(v))
+        self._video_rows = pl.display_videos()
+        self._append_video_batch()
+
+    def _clear_videos(self):
+        # reset the lazy-load state too, or a later scroll event would append
+        # rows of the previous playlist to the empty Listbox
+        self._video_rows = []
+        self._video_shown = 0
+        self.video_listbox.delete(0, 'end')
+
+    def _append_video_batch(self):
+        start = self._video_shown
+        batch = self._video_rows[start:start + _VIDEO_BATCH]
+        if batch:
+            self.video_listbox.insert('end', *batch)
+            self._video_shown = start + len(batch)
+
+    def _on_video_scroll(self, first, last):
+        # Listbox yscrollcommand: load the next batch once the view nears the end
+        if float(last) > 0.9 and self._video_shown < len(self._video_rows):
+            self._append_video_batch()
 
     # ---------- Video actions ----------
     def add_video_to_selected(self):
@@ -464,14 +739,13 @@ class App(tk.Tk):
         pl = self.channel.search_playlist(q)
         if pl:
             # select it in listbox
-            for i, p in enumerate(self.channel.playlists):
-                if p is pl:
-                    self.playlist_listbox.selection_clear(0, 'end')
-                    self.playlist_listbox.selection_set(i)
-                    self.playlist_listbox.see(i)
-                    self.on_playlist_select()
-                    self.status_var.set(f'Found playlist: {pl.playListName}')
-                    return
+            i = self.channel.index_of(pl)
+            self.playlist_listbox.selection_clear(0, 'end')
+            self.playlist_listbox.selection_set(i)
+            self.playlist_listbox.see(i)
+            self.on_playlist_select()
+            self.status_var.set(f'Found playlist: {pl.playListName}')
+            return
         messagebox.showinfo('Not found', 'Playlist not found')
         self.status_var.set('Search finished — not found')
 